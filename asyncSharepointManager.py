@@ -0,0 +1,354 @@
+from sharepointConnector import SharePointConnection
+from urllib.parse import quote
+import aiofiles
+import aiohttp
+import posixpath
+import asyncio
+import logging
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+_session = None
+_session_loop = None
+
+
+def _get_session():
+    """
+    Get the module-level aiohttp session, creating it on first use.
+
+    The session is shared by every AsyncSharePointFileManager so that connections are pooled across managers.
+    The connector caps the number of simultaneous connections to avoid SharePoint throttling.
+    A session only works on the event loop it was created on, so a new one is created when the running loop changes,
+    for example on a second `asyncio.run(...)` without `close_session()` in between.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=32))
+        _session_loop = loop
+    return _session
+
+
+async def close_session():
+    """
+    Close the module-level aiohttp session. Call this once all asynchronous work is finished.
+    """
+    global _session, _session_loop
+    if _session is not None and not _session.closed and _session_loop is asyncio.get_running_loop():
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+def _quote_odata(value):
+    """
+    Escape a value for use inside a single-quoted OData string literal in a REST URL.
+    """
+    return quote(value.replace("'", "''"))
+
+
+class AsyncSharePointFileManager:
+    """
+    AsyncSharePointFileManager manages files and folders in a SharePoint document library using asyncio.
+
+    This class issues the SharePoint REST calls directly through aiohttp instead of the synchronous office365
+    ClientContext, so bulk operations such as listing, uploading, deleting and restoring many files run concurrently
+    on a single event loop. The office365 credentials flow is only used once to obtain the authentication headers,
+    which are then cached (see SharePointConnection) and reused for every request.
+
+    Parameters:
+    - site_url (str): The URL of the SharePoint site.
+    - relative_url (str): The server relative URL of the SharePoint site.
+    - username (str, optional): The username for authentication. If not provided, the connection will use client credentials.
+    - password (str, optional): The password for authentication.
+    - client_id (str, optional): The client ID for OAuth-based authentication.
+    - client_secret (str, optional): The client secret for OAuth-based authentication.
+
+    Attributes:
+    - connection: An instance of SharePointConnection used to authenticate the REST requests.
+    - library_name (str): The name of the SharePoint library you are working with.
+    - folder_name (str): The name of the subfolder within the library.
+    - folder_url (str): The server relative URL of the current folder context.
+
+    Example Usage:
+    async def main():
+        file_manager = AsyncSharePointFileManager("your_site_url", "your_relative_url", username="your_username", password="your_password")
+        file_manager.set_folder_ctx("Shared Documents", "Subfolder")
+        files = await file_manager.get_files()
+        await close_session()
+
+    asyncio.run(main())
+    """
+
+    # The form digest is valid for 30 minutes by default, refresh it a bit earlier
+    FORM_DIGEST_TTL = 25 * 60
+
+    def __init__(self, site_url, relative_url, username=None, password=None, client_id=None, client_secret=None):
+        self.connection = SharePointConnection(site_url, username, password, client_id, client_secret)
+        self.site_url = site_url.rstrip('/')
+        self.relative_url = relative_url
+        self.library_name = None
+        self.folder_name = None
+        self.folder_url = None
+        self._token = None
+        self._token_expires_at = 0
+        self._form_digest = None
+        self._form_digest_expires_at = 0
+        self._auth_lock = None
+        self._digest_lock = None
+        self._loop = None
+
+    def set_folder_ctx(self, library_name, folder_name=''):
+        """
+        Set the current SharePoint library and folder context for file operations.
+
+        :param library_name: str
+            The name of the SharePoint library to work with. For example, "Shared Documents."
+
+        :param folder_name: str, optional
+            The name of the SharePoint subfolder within the library. This can be an empty string
+            to indicate the root of the library. (Default: Empty string)
+        """
+        self.library_name = library_name
+        self.folder_name = folder_name
+        self.folder_url = posixpath.join(self.relative_url, library_name, folder_name).rstrip('/')
+
+    def _bind_loop(self):
+        """
+        Create the manager's locks for the running event loop, the locks of an earlier loop cannot be awaited on it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._auth_lock = asyncio.Lock()
+            self._digest_lock = asyncio.Lock()
+            self._loop = loop
+
+    async def _get_token(self, rejected=None):
+        """
+        Get the cached authentication headers, fetching them in a worker thread on first use and after they expire.
+
+        :param rejected: (Optional) Headers SharePoint rejected with 401 Unauthorized. If they are still the cached
+            ones, they are dropped and new headers are fetched. Concurrent requests rejected with the same headers
+            only fetch new headers once.
+        :type rejected: dict
+        """
+        self._bind_loop()
+        async with self._auth_lock:
+            if rejected is not None and self._token is rejected:
+                await asyncio.to_thread(self.connection.invalidate_auth_headers)
+                self._token = None
+            if self._token is None or time.time() >= self._token_expires_at:
+                self._token = await asyncio.to_thread(self.connection.get_auth_headers)
+                self._token_expires_at = self.connection.auth_expires_at
+                # The digest was issued for the previous headers
+                self._form_digest = None
+        return self._token
+
+    async def _get_form_digest(self):
+        """
+        Get the cached request digest required by SharePoint for every write request.
+
+        Concurrent requests wait for a single refresh instead of each requesting a new digest.
+        """
+        self._bind_loop()
+        async with self._digest_lock:
+            if self._form_digest is None or time.monotonic() >= self._form_digest_expires_at:
+                headers = {"Accept": "application/json;odata=nometadata", **await self._get_token()}
+                async with _get_session().post(f"{self.site_url}/_api/contextinfo", headers=headers) as response:
+                    response.raise_for_status()
+                    context_info = await response.json()
+                self._form_digest = context_info["FormDigestValue"]
+                self._form_digest_expires_at = time.monotonic() + self.FORM_DIGEST_TTL
+            return self._form_digest
+
+    async def _request(self, method, url, headers=None, data=None, **kwargs):
+        """
+        Send an authenticated SharePoint REST request through the shared aiohttp session.
+
+        When SharePoint rejects the authentication headers (401), new headers are fetched and the request is sent once more.
+
+        :param method: The HTTP method of the request.
+        :type method: str
+
+        :param url: The absolute REST endpoint URL.
+        :type url: str
+
+        :param headers: (Optional) Additional request headers.
+        :type headers: dict
+
+        :param data: (Optional) The request body, or a callable returning it, so that a streamed body can be sent again.
+
+        :return: The decoded JSON response, or None if the response has no JSON body.
+
+        :raises:
+            aiohttp.ClientResponseError: If SharePoint returns an error status.
+        """
+        rejected = None
+        for attempt in range(2):
+            token = await self._get_token(rejected)
+            request_headers = {"Accept": "application/json;odata=nometadata", **token}
+            if method != "GET":
+                request_headers["X-RequestDigest"] = await self._get_form_digest()
+            if headers:
+                request_headers.update(headers)
+
+            body = data() if callable(data) else data
+            async with _get_session().request(method, url, headers=request_headers, data=body, **kwargs) as response:
+                if response.status == 401 and attempt == 0:
+                    rejected = token
+                    continue
+                response.raise_for_status()
+                if response.content_type == "application/json":
+                    return await response.json()
+                return None
+
+    def _folder_api_url(self):
+        return f"{self.site_url}/_api/web/GetFolderByServerRelativeUrl('{_quote_odata(self.folder_url)}')"
+
+    async def get_files(self):
+        """
+        Retrieve the SharePoint files within the current library and folder context.
+
+        :return: A list of file property dictionaries as returned by the SharePoint REST API.
+        :rtype: list of dict
+        """
+        try:
+            result = await self._request("GET", f"{self._folder_api_url()}/Files")
+            return result["value"]
+        except Exception as e:
+            logger.error("Error getting files: %s", e)
+
+    async def get_folders(self):
+        """
+        Retrieve the SharePoint folders within the current library and folder context.
+
+        :return: A list of folder property dictionaries as returned by the SharePoint REST API.
+        :rtype: list of dict
+        """
+        try:
+            result = await self._request("GET", f"{self._folder_api_url()}/Folders")
+            return result["value"]
+        except Exception as e:
+            logger.error("Error getting folders: %s", e)
+
+    async def _read_chunks(self, local_path, chunk_size=64 * 1024):
+        """
+        Stream a local file in chunks so the upload never holds the whole file in memory.
+        """
+        async with aiofiles.open(local_path, 'rb') as content_file:
+            while True:
+                chunk = await content_file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    async def upload_file(self, local_path, file_name=None):
+        """
+        Upload a file to the current SharePoint folder, overwriting an existing file with the same name if it exists.
+
+        The file content is streamed from disk instead of being read into memory first.
+
+        :param local_path: The local file path to upload.
+        :type local_path: str
+
+        :param file_name: (Optional) The desired name for the file in SharePoint. If not provided, the original filename will be used.
+        :type file_name: str
+
+        :return: True if the file was uploaded, False otherwise.
+        :rtype: bool
+        """
+        try:
+            if file_name is None:
+                file_name = os.path.basename(local_path)
+
+            url = f"{self._folder_api_url()}/Files/add(url='{_quote_odata(file_name)}',overwrite=true)"
+            headers = {"Content-Length": str(os.path.getsize(local_path))}
+            await self._request("POST", url, headers=headers, data=lambda: self._read_chunks(local_path))
+            logger.debug("Uploaded file with override: %s", file_name)
+            return True
+        except Exception as e:
+            logger.error("Error uploading file with override: %s", e)
+            return False
+
+    async def upload_multiple_files(self, local_file_paths):
+        """
+        Upload multiple files to the current SharePoint folder concurrently, overwriting existing files with the same names.
+
+        :param local_file_paths: A list of local file paths to upload.
+        :type local_file_paths: list of str
+        """
+        start = time.monotonic()
+        results = await asyncio.gather(*[self.upload_file(local_path) for local_path in local_file_paths])
+        logger.info("Uploaded %d files in %.1fs", sum(results), time.monotonic() - start)
+
+    async def _delete(self, file_name):
+        url = f"{self.site_url}/_api/web/GetFileByServerRelativeUrl('{_quote_odata(f'{self.folder_url}/{file_name}')}')"
+        await self._request("POST", url, headers={"X-HTTP-Method": "DELETE", "IF-MATCH": "*"})
+
+    async def delete_file(self, file_name):
+        """
+        Delete a specific file by its name from the current SharePoint folder context.
+
+        :param file_name: The name of the file to be deleted.
+        :type file_name: str
+        """
+        try:
+            await self._delete(file_name)
+            logger.debug("Deleted file: %s", file_name)
+        except Exception as e:
+            logger.error("Error deleting file: %s", e)
+
+    async def delete_multiple_files(self, file_names):
+        """
+        Delete multiple files concurrently from the current SharePoint folder.
+
+        :param file_names: A list of file names to be deleted.
+        :type file_names: List[str]
+        """
+        await asyncio.gather(*[self.delete_file(file_name) for file_name in file_names])
+
+    async def get_recently_deleted_items(self, max_items=5):
+        """
+        Retrieve recently deleted items from the SharePoint recycle bin, newest first.
+
+        The sorting and limiting are done by SharePoint, so only the requested items are transferred.
+
+        :param max_items: The maximum number of recently deleted items to retrieve. Default is 5.
+        :type max_items: int
+
+        :return: A list of recycle bin item property dictionaries.
+        :rtype: list of dict
+        """
+        try:
+            params = {"$orderby": "DeletedDate desc"}
+            if max_items is not None:
+                params["$top"] = str(max_items)
+            result = await self._request("GET", f"{self.site_url}/_api/site/RecycleBin", params=params)
+            return result["value"]
+        except Exception as e:
+            logger.error("Error getting recently deleted items: %s", e)
+
+    async def _restore(self, item):
+        try:
+            await self._request("POST", f"{self.site_url}/_api/site/RecycleBin('{item['Id']}')/restore()")
+            logger.debug("Item recovered to %s file name is %s", item['DirName'], item['Title'])
+            return True
+        except Exception as e:
+            logger.error("Error restoring %s: %s", item['Title'], e)
+            return False
+
+    async def recover_data(self, num_to_restore=1):
+        """
+        Recover recently deleted items from the SharePoint recycle bin concurrently.
+
+        :param num_to_restore: The number of recently deleted items to recover.
+        :type num_to_restore: int
+        """
+        try:
+            recently_deleted_items = await self.get_recently_deleted_items(num_to_restore)
+            results = await asyncio.gather(*[self._restore(item) for item in recently_deleted_items])
+            logger.info("Restored %d items", sum(results))
+        except Exception as e:
+            logger.error("Error restoring files: %s", e)
@@ -1,4 +1,5 @@
 from sharepointManager import SharePointFileManager
+import logging
 from config import site_url, library_name, folder_name
 from config import client_id, client_secret
 # or
@@ -6,6 +7,7 @@ from config import username, password
 
 # Usage example in main.py:
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     
     sharepoint = SharePointFileManager(site_url, username=username, password=password)
     # # or
@@ -1,12 +1,54 @@
 from office365.runtime.auth.client_credential import ClientCredential
 from office365.runtime.auth.user_credential import UserCredential
+from office365.runtime.http.request_options import RequestOptions
 from office365.sharepoint.client_context import ClientContext
+import functools
+import threading
+import hashlib
+import logging
+import json
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+try:
+    import keyring
+    import keyring.errors
+except ImportError:
+    keyring = None
+
+# Directory holding the cached authentication headers when keyring is not available
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'sharepoint_connector')
+
+# Service name used to store the cached authentication headers in keyring
+KEYRING_SERVICE = 'sharepoint_connector'
+
+# Headers set by the office365 credential providers: bearer token (client credentials) or SAML cookies (user credentials)
+AUTH_HEADERS = ('Authorization', 'Cookie')
+
+
+@functools.lru_cache(maxsize=None)
+def _keyring_available():
+    """
+    Check whether keyring is installed and has a backend to store passwords in.
+
+    Without one, the default on headless Linux and CI, keyring falls back to a backend that raises on every call.
+    """
+    if keyring is None:
+        return False
+    from keyring.backends import fail
+    try:
+        return not isinstance(keyring.get_keyring(), fail.Keyring)
+    except Exception:
+        return False
+
 
 class SharePointConnection:
     """
     SharePointConnection manages the connection to a SharePoint site using client or user credentials.
 
-    This class provides a singleton instance for connecting to a SharePoint site based on the provided authentication method.
+    This class connects to a SharePoint site based on the provided authentication method.
     You can connect using either user credentials (username and password) or client credentials (client ID and client secret).
 
     Author:
@@ -26,41 +68,194 @@ class SharePointConnection:
     - client_secret (str, optional): The client secret for client credentials. (Default: None)
 
     Attributes:
-    - ctx (ClientContext): The SharePoint ClientContext instance for making API requests.
+    - ctx (ClientContext): The SharePoint ClientContext instance of the calling thread for making API requests.
 
     Note:
-    - This class implements the Singleton design pattern to ensure there is only one active connection instance.
+    - The office365 ClientContext is not thread-safe, so each thread gets its own ClientContext, created on first access.
+    - The authentication headers obtained by the credentials flow are cached for `TOKEN_CACHE_TTL` seconds, in keyring
+      when it is installed with a working backend or else in a file readable only by the current user under `~/.cache/sharepoint_connector`.
+      A later process with the same credentials reuses them and skips the authentication handshake. Within a process
+      the headers are kept in memory until they expire, or until SharePoint rejects them (see `invalidate_auth_headers`).
     """
 
-    _instance = None
+    # Access tokens and SAML cookies are valid for about an hour, reuse them a bit less than that
+    TOKEN_CACHE_TTL = 50 * 60
+
+    def __init__(self, site_url, username=None, password=None, client_id=None, client_secret=None):
+        self.site_url = site_url
+        self.username = username
+        self.password = password
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self._tls = threading.local()
+        self._auth_headers = None
+        self._auth_expires_at = 0
+        self._auth_lock = threading.Lock()
 
-    def __new__(cls, site_url, username=None, password=None, client_id=None, client_secret=None):
-        if cls._instance is None:
-            cls._instance = super(SharePointConnection, cls).__new__(cls)
-            cls._instance.site_url = site_url
-            cls._instance.username = username
-            cls._instance.password = password
-            cls._instance.client_id = client_id
-            cls._instance.client_secret = client_secret
-            cls._instance.ctx = cls._instance._connect_to_sharepoint()
-        return cls._instance
+    @property
+    def ctx(self):
+        """
+        The SharePoint ClientContext of the calling thread, connected on first access.
+        """
+        ctx = getattr(self._tls, 'ctx', None)
+        if ctx is None:
+            ctx = self._tls.ctx = self._connect_to_sharepoint()
+        return ctx
 
     def _connect_to_sharepoint(self):
         """
         Create a SharePoint ClientContext based on the provided authentication method.
 
+        The ClientContext authenticates its requests with the cached authentication headers, see `get_auth_headers`.
+
         Returns:
         - ctx (ClientContext): The SharePoint ClientContext instance.
 
         Raises:
         - ValueError: If neither username and password nor client ID and secret are provided.
         """
+        ctx = self._create_context()
+        ctx.authentication_context.authenticate_request = lambda request: request.headers.update(self.get_auth_headers())
+        return ctx
+
+    def _create_context(self):
+        """
+        Create a SharePoint ClientContext running the credentials flow of the provided authentication method.
+        """
         if self.username and self.password:
             user_credentials = UserCredential(self.username, self.password)
-            ctx = ClientContext(self.site_url).with_credentials(user_credentials)
+            return ClientContext(self.site_url).with_credentials(user_credentials)
         elif self.client_id and self.client_secret:
             client_credentials = ClientCredential(self.client_id, self.client_secret)
-            ctx = ClientContext(self.site_url).with_credentials(client_credentials)
+            return ClientContext(self.site_url).with_credentials(client_credentials)
         else:
             raise ValueError("Provide either username and password or client ID and secret.")
-        return ctx
\ No newline at end of file
+
+    def get_auth_headers(self):
+        """
+        Get the authentication headers for a request to the SharePoint site.
+
+        The headers are kept in memory until they expire, so the persistent cache is only read at startup and after
+        expiry. When it holds no valid headers either, the credentials flow is run and its headers are cached.
+
+        :return: The authentication headers (bearer token or SAML cookies).
+        :rtype: dict
+        """
+        with self._auth_lock:
+            if self._auth_headers is None or self._auth_expires_at <= time.time():
+                cached = self._load_auth_headers()
+                if cached is None:
+                    # Authenticate on a new ClientContext, its credentials provider has no token cached yet
+                    auth_request = RequestOptions(self.site_url)
+                    self._create_context().authentication_context.authenticate_request(auth_request)
+                    headers = {name: value for name, value in auth_request.headers.items() if name in AUTH_HEADERS}
+                    cached = (headers, time.time() + self.TOKEN_CACHE_TTL)
+                    self._save_auth_headers(*cached)
+                self._auth_headers, self._auth_expires_at = cached
+            return dict(self._auth_headers)
+
+    @property
+    def auth_expires_at(self):
+        """
+        The time (as returned by time.time()) at which the authentication headers returned by `get_auth_headers` expire.
+        """
+        return self._auth_expires_at
+
+    def invalidate_auth_headers(self):
+        """
+        Drop the cached authentication headers after SharePoint rejected them (401 Unauthorized).
+
+        The headers are removed from memory and from the persistent cache, so the next request runs the credentials
+        flow again.
+        """
+        with self._auth_lock:
+            self._auth_headers = None
+            self._auth_expires_at = 0
+            self._delete_token_cache()
+
+    def _token_cache_key(self):
+        """
+        Get a hash of the site and credentials, used to name the cache entry without storing the secrets.
+        """
+        credentials = '|'.join(str(value) for value in (self.site_url, self.username, self.password, self.client_id, self.client_secret))
+        return hashlib.sha256(credentials.encode('utf-8')).hexdigest()
+
+    def _token_cache_path(self):
+        return os.path.join(TOKEN_CACHE_DIR, f'{self._token_cache_key()}.json')
+
+    def _load_auth_headers(self):
+        """
+        Load the cached authentication headers.
+
+        :return: The cached headers and their expiry time, or None if nothing is cached or the cached headers are expired.
+        :rtype: tuple of (dict, float) or None
+        """
+        try:
+            cached = self._read_token_cache()
+            if not cached:
+                return None
+            cached = json.loads(cached)
+            if cached['expires_at'] <= time.time():
+                return None
+            return cached['headers'], cached['expires_at']
+        except Exception:
+            return None
+
+    def _save_auth_headers(self, headers, expires_at):
+        """
+        Cache the authentication headers until they expire.
+
+        :param headers: The authentication headers to cache.
+        :type headers: dict
+
+        :param expires_at: The time (as returned by time.time()) at which the headers expire.
+        :type expires_at: float
+        """
+        if not headers:
+            return
+        cached = json.dumps({'expires_at': expires_at, 'headers': headers})
+        try:
+            self._write_token_cache(cached)
+        except Exception as e:
+            logger.error("Error caching authentication headers: %s", e)
+
+    def _read_token_cache(self):
+        """
+        Read the cache entry from keyring, or from the cache file when keyring cannot be used.
+        """
+        if _keyring_available():
+            try:
+                return keyring.get_password(KEYRING_SERVICE, self._token_cache_key())
+            except keyring.errors.KeyringError:
+                pass
+        with open(self._token_cache_path(), 'r') as cache_file:
+            return cache_file.read()
+
+    def _write_token_cache(self, cached):
+        """
+        Write the cache entry to keyring, or to a file readable only by the current user when keyring cannot be used.
+        """
+        if _keyring_available():
+            try:
+                keyring.set_password(KEYRING_SERVICE, self._token_cache_key(), cached)
+                return
+            except keyring.errors.KeyringError:
+                pass
+        os.makedirs(TOKEN_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(self._token_cache_path(), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as cache_file:
+            cache_file.write(cached)
+
+    def _delete_token_cache(self):
+        """
+        Delete the cache entry from keyring and from the cache file, whichever holds it.
+        """
+        if _keyring_available():
+            try:
+                keyring.delete_password(KEYRING_SERVICE, self._token_cache_key())
+            except keyring.errors.KeyringError:
+                pass
+        try:
+            os.remove(self._token_cache_path())
+        except OSError:
+            pass
\ No newline at end of file
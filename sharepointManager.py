@@ -1,5 +1,92 @@
 from sharepointConnector import SharePointConnection
+from office365.runtime.client_request_exception import ClientRequestException
+from office365.runtime.odata.v3.batch_request import DEFAULT_MAX_BATCH_BYTES, ODataBatchV3Request
+from office365.runtime.odata.v3.json_light_format import JsonLightFormat
+from office365.runtime.retry import TRANSIENT_STATUS_CODES
+from office365.sharepoint.exceptions import SecurityValidationException
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+import functools
+import threading
+import posixpath
+import tempfile
+import zipfile
+import logging
+import random
+import mmap
+import time
 import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# Status codes SharePoint returns when it throttles requests
+RETRY_STATUS_CODES = (429, 503)
+
+# Number of attempts made for a throttled request before giving up
+MAX_RETRIES = 6
+
+
+def _with_retry(fn):
+    """
+    Retry the decorated function when SharePoint throttles the request.
+
+    The delay before each new attempt is taken from the Retry-After header when SharePoint sends one,
+    otherwise it grows exponentially. A random jitter keeps parallel workers from retrying in lockstep.
+    When SharePoint rejects the cached authentication headers (401), they are dropped and the request is
+    sent once more with new ones. Other errors, and the last throttled attempt, are raised as usual.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        reauthenticated = False
+        for attempt in range(MAX_RETRIES):
+            try:
+                return fn(self, *args, **kwargs)
+            except ClientRequestException as e:
+                response = e.response
+                if response is not None and response.status_code == 401 and not reauthenticated and attempt < MAX_RETRIES - 1:
+                    self.invalidate_auth_headers()
+                    reauthenticated = True
+                    continue
+                if response is None or response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES - 1:
+                    raise
+                try:
+                    delay = float(response.headers.get('Retry-After', 2 ** attempt))
+                except ValueError:
+                    delay = 2 ** attempt
+                time.sleep(delay + random.random())
+    return wrapper
+
+
+class _PartialBatchRequest(ODataBatchV3Request):
+    """
+    $batch request that records the sub-requests SharePoint rejects instead of raising at the first one.
+
+    The office365 batch request stops processing the batch response at the first failed sub-request, which hides
+    whether the following ones succeeded. Here every rejected sub-request is recorded in `failed` and skipped, so
+    the rest of the response is still processed. Throttled sub-requests are passed on as usual and retried by
+    the batch request, and an expired form digest is still raised so the ClientContext can refresh it.
+
+    This relies on internals of Office365-REST-Python-Client 3.2.0, the version pinned in requirements.txt.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.succeeded = set()
+        self.failed = {}
+
+    def _extract_response(self, response, query):
+        for sub_qry, sub_resp in super()._extract_response(response, query):
+            if sub_resp.status_code < 400:
+                self.succeeded.add(sub_qry)
+            elif sub_resp.status_code not in TRANSIENT_STATUS_CODES:
+                error = ClientRequestException.from_response(sub_resp)
+                if isinstance(error, SecurityValidationException):
+                    raise error
+                self.failed[sub_qry] = error
+                continue
+            yield sub_qry, sub_resp
+
 
 class SharePointFileManager(SharePointConnection):
     """
@@ -19,28 +106,131 @@ class SharePointFileManager(SharePointConnection):
     - password (str, optional): The password for authentication.
     - client_id (str, optional): The client ID for OAuth-based authentication.
     - client_secret (str, optional): The client secret for OAuth-based authentication.
+    - cache_ttl (float, optional): The number of seconds a listing of existing file names is reused before it is fetched again. (Default: 300)
 
     Attributes:
-    - connection: An instance of SharePointConnection to handle the low-level SharePoint API operations.
     - existing_files (set): A set containing the names of existing SharePoint files in the current library and folder context.
+    - cache_ttl (float): The number of seconds a cached listing of existing file names stays valid.
     - library_name (str): The name of the SharePoint library you are working with.
     - folder_name (str): The name of the subfolder within the library.
-    - folder: The SharePoint folder object representing the current context.
+    - folder: The SharePoint folder object representing the current context, bound to the calling thread's ClientContext.
 
     Example Usage:
-    connection = SharePointConnection("your_site_url", username="your_username", password="your_password")
-    file_manager = SharePointFileManager(connection)
+    file_manager = SharePointFileManager("your_site_url", "your_relative_url", username="your_username", password="your_password")
     file_manager.set_folder_ctx("Shared Documents", "Subfolder")
     files = file_manager.get_files()
     """
-    def __init__(self, site_url, relative_url, username=None, password=None, client_id=None, client_secret=None):
-        self.connection = SharePointConnection(site_url, username, password, client_id, client_secret)
+    # SharePoint accepts at most 100 sub-requests in a single $batch request
+    BATCH_SIZE = 100
+
+    # Number of files requested per page when listing a folder
+    PAGE_SIZE = 500
+
+    # Files of at least this size are uploaded in chunks through an upload session
+    CHUNK_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, site_url, relative_url, username=None, password=None, client_id=None, client_secret=None, cache_ttl=300):
+        super().__init__(site_url, username, password, client_id, client_secret)
         self.relative_url = relative_url
-        self.existing_files = set()
+        self.cache_ttl = cache_ttl
+        self._existing_cache = {}
         self.library_name = None
         self.folder_name = None
-        self.folder = None
+        self._folder_server_url = None
+        self._lock = threading.Lock()
+
+    @property
+    def folder(self):
+        """
+        The SharePoint folder object of the current context, bound to the calling thread's ClientContext.
+
+        Folder objects are cached per library and folder, so switching back to an earlier context with
+        `set_folder_ctx` reuses the folder object and the metadata already loaded on it.
+        """
+        if self.library_name is None:
+            return None
+        folder_cache = getattr(self._tls, 'folder_cache', None)
+        if folder_cache is None:
+            folder_cache = self._tls.folder_cache = {}
+        key = (self.library_name, self.folder_name)
+        folder = folder_cache.get(key)
+        if folder is None:
+            folder = folder_cache[key] = self.ctx.web.get_folder_by_server_relative_url(self._folder_server_url)
+        return folder
     
+    @_with_retry
+    def _execute_query(self, queue_query):
+        """
+        Queue a query on the calling thread's ClientContext and execute it, retrying when SharePoint throttles it.
+
+        The ClientContext is discarded when the query fails, so the query is queued again on a new one on every attempt.
+
+        :param queue_query: A callable queueing the query, for example `lambda: self.ctx.load(files)`.
+        """
+        try:
+            queue_query()
+            self.ctx.execute_query()
+        except Exception:
+            self._discard_ctx()
+            raise
+
+    def _execute_batch(self, items, queue_item):
+        """
+        Queue one query per item on the calling thread's ClientContext and execute them in $batch requests.
+
+        A sub-request SharePoint rejects does not stop the others, in the same batch or in the following ones.
+        The batches are not retried as a whole: throttled sub-requests are retried on their own, so the
+        operations that succeeded are never sent twice.
+
+        :param items: The items to send a query for.
+        :type items: list
+
+        :param queue_item: A callable queueing exactly one query for the given item, for example
+            `lambda item: item.restore()`.
+
+        :return: The items whose query failed, with the error of each one, in the order of `items`.
+        :rtype: list of (item, Exception) tuples
+        """
+        ctx = self.ctx
+        try:
+            for item in items:
+                queue_item(item)
+            request = ctx.pending_request()
+            request.warm_up()
+            batches = ctx._split_batches(self.BATCH_SIZE, DEFAULT_MAX_BATCH_BYTES)
+        except Exception:
+            self._discard_ctx()
+            raise
+
+        # Same setup as ClientContext.execute_batch, with a batch request that keeps going after a failed sub-request
+        batch_request = _PartialBatchRequest(ctx.base_url, JsonLightFormat(), transport=request.transport)
+        batch_request.beforeExecute += request._authenticate_request
+        batch_request.beforeExecute += request.ensure_form_digest
+
+        queries = [qry for batch in batches for qry in batch.queries]
+        errors = {}
+        for batch in batches:
+            try:
+                ctx._run_batch(batch_request, batch)
+            except Exception as e:
+                # The whole batch failed, e.g. still throttled after all retries
+                if isinstance(e, ClientRequestException) and e.response is not None and e.response.status_code == 401:
+                    self.invalidate_auth_headers()
+                for qry in batch.queries:
+                    if qry not in batch_request.succeeded:
+                        errors.setdefault(qry, e)
+        errors.update(batch_request.failed)
+        return [(item, errors[qry]) for item, qry in zip(items, queries) if qry in errors]
+
+    def _discard_ctx(self):
+        """
+        Drop the calling thread's ClientContext and the folder objects bound to it after a failed request.
+
+        The failed ClientContext may still hold queued queries, so the next access connects a new one instead.
+        """
+        self._tls.ctx = None
+        self._tls.folder_cache = None
+
     def set_folder_ctx(self, library_name, folder_name=''):
         """
         Set the current SharePoint library and folder context for file operations.
@@ -59,37 +249,86 @@ class SharePointFileManager(SharePointConnection):
         try:
             self.library_name = library_name
             self.folder_name = folder_name
-            self.folder = self.ctx.web.get_folder_by_server_relative_url(f'{self.relative_url}/{library_name}/{folder_name}')
+            # Joined once here and reused for every file URL, posixpath.join avoids a '//' when relative_url ends with '/'
+            self._folder_server_url = posixpath.join(self.relative_url, library_name, folder_name).rstrip('/')
         except Exception as e:
-            print(f"Error setting folder context: {str(e)}")
+            logger.error("Error setting folder context: %s", e)
              
 
-    def get_files(self):
+    def get_files(self, properties=None, page_size=PAGE_SIZE):
         """
-        Retrieve a list of SharePoint file objects within the current library and folder context.
+        Iterate over the SharePoint file objects within the current library and folder context.
+
+        The files are requested from SharePoint one page at a time, and the next page is only fetched
+        once the previous one has been consumed. A throttled page is retried like any other request.
+        Use `list(...)` if you need all files at once.
 
-        :return: list of SharePoint file objects
-            A list containing SharePoint file objects within the current context.
+        :param properties: list of str, optional
+            The names of the properties to retrieve, for example ["Name"]. Only these properties are
+            requested from SharePoint ($select), which keeps the response small. (Default: all properties)
+
+        :param page_size: int, optional
+            The number of files requested per page. (Default: 500)
+
+        :return: generator of SharePoint file objects
+            The SharePoint file objects within the current context.
 
         :raises Exception:
             If an error occurs while retrieving files, an exception will be raised
             with details about the error.
         """
         try:
-            files = self.folder.files
-            self.ctx.load(files)
-            self.ctx.execute_query()
-            return [file for file in files]
+            yield from self._iter_collection(lambda: self.folder.files, properties, page_size)
         except Exception as e:
-            print(f"Error getting files: {str(e)}")
+            logger.error("Error getting files: %s", e)
 
+    def _iter_collection(self, get_collection, properties=None, page_size=PAGE_SIZE):
+        """
+        Iterate over a file or folder collection of the current context, one page at a time.
 
-    def get_folders(self):
+        Every page is requested on a new collection ($skip and $top) through `_execute_query`, so a throttled page
+        is retried on its own instead of ending the listing early. Unlike `get_files` and `get_folders`, errors are
+        raised, so a failed listing is never mistaken for an empty one.
+
+        :param get_collection: A callable returning the collection to list, for example `lambda: self.folder.files`.
+
+        :param properties: The names of the properties to retrieve, or None for all properties.
+        :type properties: list of str
+
+        :param page_size: The number of items requested per page, or None to load the collection in a single request.
+        :type page_size: int
+
+        :return: generator of SharePoint file or folder objects
+        """
+        position = 0
+        while True:
+            pages = []
+
+            def queue_page():
+                page = get_collection()
+                if page_size is not None:
+                    page = page.skip(position).top(page_size)
+                pages.append(page)
+                self.ctx.load(page, properties)
+
+            self._execute_query(queue_page)
+            items = list(pages[-1])
+            yield from items
+            if page_size is None or len(items) < page_size:
+                return
+            position += len(items)
+
+
+    def get_folders(self, properties=None):
         """
-        Retrieve a list of SharePoint folder objects within the current library and folder context.
+        Retrieve the SharePoint folder objects within the current library and folder context.
+
+        :param properties: list of str, optional
+            The names of the properties to retrieve, for example ["Name"]. Only these properties are
+            requested from SharePoint ($select), which keeps the response small. (Default: all properties)
 
-        :return: list of SharePoint folder objects
-            A list containing SharePoint folder objects within the current context.
+        :return: iterable of SharePoint folder objects
+            The loaded folder collection of the current context. Iterate over it, or use `list(...)` if you need a list.
 
         :raises Exception:
             If an error occurs while retrieving folders, an exception will be raised
@@ -97,16 +336,58 @@ class SharePointFileManager(SharePointConnection):
         """
         try:
             folders = self.folder.folders
-            self.ctx.load(folders)
-            self.ctx.execute_query()
-            return [folder for folder in folders]
+            self._execute_query(lambda: self.ctx.load(folders, properties))
+            return folders
         except Exception as e:
-            print(f"Error getting folders: {str(e)}")
+            logger.error("Error getting folders: %s", e)
+
+    @property
+    def existing_files(self):
+        """
+        The cached set of existing SharePoint file names within the current library and folder context.
+
+        An empty set is returned when the current context has not been listed yet.
+        """
+        entry = self._existing_cache.get((self.library_name, self.folder_name))
+        return entry[1] if entry else set()
+
+    @property
+    def _suffix_counter(self):
+        """
+        The next free numeric suffix per (base name, extension) within the current library and folder context.
+        """
+        entry = self._existing_cache.get((self.library_name, self.folder_name))
+        return entry[2] if entry else {}
+
+    @staticmethod
+    def _build_suffix_counter(file_names):
+        """
+        Scan existing file names once and compute the next free suffix for each base name and extension.
+
+        For example, if "report.txt" and "report_3.txt" exist, the next suffix for ("report", ".txt") is 4.
+
+        :param file_names: The existing file names.
+        :type file_names: set of str
+
+        :return: A dictionary mapping (base name, extension) to the next suffix to try.
+        :rtype: dict
+        """
+        suffix_counter = {}
+        for file_name in file_names:
+            base_name, ext = os.path.splitext(file_name)
+            match = re.match(r'^(.*)_(\d+)$', base_name)
+            if match:
+                key = (match.group(1), ext)
+                suffix_counter[key] = max(suffix_counter.get(key, 1), int(match.group(2)) + 1)
+        return suffix_counter
 
     def _get_existing_files(self):
         """
         Retrieve a set of existing SharePoint file names within the current library and folder context.
 
+        The listing is cached per library and folder, and is only fetched again from SharePoint once it is
+        older than `cache_ttl` seconds. Uploads and deletions keep the cached set up to date.
+
         :return: set of file names
             A set containing the names of existing SharePoint files within the current context.
 
@@ -115,16 +396,23 @@ class SharePointFileManager(SharePointConnection):
             with details about the error.
         """
         try:
-            files = self.get_files()
-            self.existing_files = set(map(lambda file: file['Name'], files))
+            key = (self.library_name, self.folder_name)
+            entry = self._existing_cache.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.cache_ttl:
+                # Not using get_files, which reports errors instead of raising them: caching an
+                # incomplete listing would let uploads without override overwrite files
+                file_names = {file.properties['Name'] for file in self._iter_collection(lambda: self.folder.files, ["Name"])}
+                entry = (time.monotonic(), file_names, self._build_suffix_counter(file_names))
+                self._existing_cache[key] = entry
+            return entry[1]
         except Exception as e:
-            print(f"Error getting existing files: {str(e)}")    
+            logger.error("Error getting existing files: %s", e)
 
     def _reset_existing_files(self):
         """
-        Clear the set of existing SharePoint file names within the current library and folder context.
+        Drop the cached set of existing SharePoint file names within the current library and folder context.
         """
-        self.existing_files.clear()
+        self._existing_cache.pop((self.library_name, self.folder_name), None)
 
 
     def create_sharepoint_folder(self, parent_folder_url):
@@ -138,11 +426,10 @@ class SharePointFileManager(SharePointConnection):
             Exception: If an error occurs during folder creation.
         """
         try:
-            self.folder.add(parent_folder_url)
-            self.ctx.execute_query()
-            print(f"Created SharePoint folder: {parent_folder_url}")
+            self._execute_query(lambda: self.folder.add(parent_folder_url))
+            logger.info("Created SharePoint folder: %s", parent_folder_url)
         except Exception as e:
-            print(f"Error creating SharePoint folder: {str(e)}") 
+            logger.error("Error creating SharePoint folder: %s", e)
 
     def get_file_name(self, file_name):
         """
@@ -150,6 +437,8 @@ class SharePointFileManager(SharePointConnection):
 
         This method ensures that the given file name is unique within the current folder context. 
         If a file with the same name already exists, a unique name is generated by appending an incrementing suffix.
+        The next suffix to try is remembered per base name, so repeated uploads of the same name do not probe
+        every suffix already taken.
 
         :param file_name: The original file name.
         :type file_name: str
@@ -161,20 +450,99 @@ class SharePointFileManager(SharePointConnection):
             Exception: If an error occurs while generating a unique file name.
         """
         try:
+            if file_name not in self.existing_files:
+                return file_name
+
             base_name, ext = os.path.splitext(file_name)
-            unique_suffix = 1
+            suffix_counter = self._suffix_counter
+            unique_suffix = suffix_counter.get((base_name, ext), 1)
 
-            while file_name in self.existing_files:
-                file_name = f"{base_name}_{unique_suffix}{ext}"
+            while f"{base_name}_{unique_suffix}{ext}" in self.existing_files:
                 unique_suffix += 1
 
-            return file_name
+            suffix_counter[(base_name, ext)] = unique_suffix + 1
+            return f"{base_name}_{unique_suffix}{ext}"
         except Exception as e:
-            print(f"Error getting file name: {str(e)}")
+            logger.error("Error getting file name: %s", e)
 
              
 
-    def upload_file(self, local_path):
+    def _upload_one(self, local_path, file_name=None, override=True, chunk_size=CHUNK_SIZE):
+        """
+        Upload a single file through the calling thread's ClientContext.
+
+        Files smaller than `chunk_size` are memory-mapped and sent in a single request, without copying them into
+        a bytes object first. Larger files are streamed through an upload session one chunk at a time, so memory use
+        stays bounded by the chunk size.
+
+        When `override` is False, the unique file name is picked and reserved in `existing_files` while holding
+        the lock, so two threads never choose the same suffix.
+
+        :param local_path: The local file path to upload.
+        :type local_path: str
+
+        :param file_name: (Optional) The desired name for the file in SharePoint. Defaults to the local file name.
+        :type file_name: str
+
+        :param override: Whether an existing file with the same name is overwritten. (Default: True)
+        :type override: bool
+
+        :param chunk_size: The size in bytes of each uploaded chunk for large files. (Default: 4 MB)
+        :type chunk_size: int
+
+        :return: True if the file was uploaded, False otherwise.
+        :rtype: bool
+        """
+        mode = "with override" if override else "without override"
+        if file_name is None:
+            file_name = os.path.basename(local_path)
+
+        try:
+            if not override:
+                with self._lock:
+                    file_name = self.get_file_name(file_name)
+                    self.existing_files.add(file_name)
+
+            self._upload_content(local_path, file_name, chunk_size)
+
+            with self._lock:
+                self.existing_files.add(file_name)
+            logger.debug("Uploaded file %s: %s", mode, file_name)
+            return True
+        except Exception as e:
+            if not override:
+                with self._lock:
+                    self.existing_files.discard(file_name)
+            logger.error("Error uploading file %s: %s", mode, e)
+            return False
+
+    @_with_retry
+    def _upload_content(self, local_path, file_name, chunk_size):
+        """
+        Send the content of a local file to the current SharePoint folder, retrying when SharePoint throttles it.
+
+        The file is opened again on every attempt, so a retried upload always starts from the beginning.
+        """
+        try:
+            file_size = os.path.getsize(local_path)
+            with open(local_path, 'rb') as content_file:
+                if file_size >= chunk_size:
+                    self.folder.files.create_upload_session(content_file, chunk_size, file_name=file_name)
+                    self.ctx.execute_query()
+                elif file_size == 0:
+                    # Empty files cannot be memory-mapped
+                    self.folder.files.add(file_name, b'', True)
+                    self.ctx.execute_query()
+                else:
+                    # FileCollection.add sends the memory map as the request body as is, without copying it
+                    with mmap.mmap(content_file.fileno(), 0, access=mmap.ACCESS_READ) as file_content:
+                        self.folder.files.add(file_name, file_content, True)
+                        self.ctx.execute_query()
+        except Exception:
+            self._discard_ctx()
+            raise
+
+    def upload_file(self, local_path, chunk_size=CHUNK_SIZE):
         """
         Upload a file to the current SharePoint folder, overwriting an existing file with the same name if it exists.
 
@@ -185,24 +553,16 @@ class SharePointFileManager(SharePointConnection):
         :param local_path: The local file path to upload, replacing any existing file with the same name.
         :type local_path: str
 
+        :param chunk_size: Files of at least this many bytes are uploaded in chunks of this size. (Default: 4 MB)
+        :type chunk_size: int
+
         :raises:
             Exception: If an error occurs during the upload process.
         """
-        try:
-            file_name = os.path.basename(local_path)
-
-            with open(local_path, 'rb') as content_file:
-                file_content = content_file.read()
-                self.folder.upload_file(file_name=file_name, content=file_content)
-
-            self.ctx.execute_query()
-            self.existing_files.add(file_name)
-            print(f"Uploaded file with override: {file_name}")
-        except Exception as e:
-            print(f"Error uploading file with override: {str(e)}")
+        self._upload_one(local_path, chunk_size=chunk_size)
 
     
-    def upload_file_without_override(self, local_path, file_name=None):
+    def upload_file_without_override(self, local_path, file_name=None, chunk_size=CHUNK_SIZE):
         """
         Upload a file to the current SharePoint folder, avoiding overwriting an existing file with the same name.
 
@@ -216,74 +576,131 @@ class SharePointFileManager(SharePointConnection):
         :param file_name: (Optional) The desired name for the file in SharePoint. If not provided, the original filename will be used.
         :type file_name: str
 
+        :param chunk_size: Files of at least this many bytes are uploaded in chunks of this size. (Default: 4 MB)
+        :type chunk_size: int
+
         :raises:
             Exception: If an error occurs during the upload process.
         """
-        try:
-            if not self.existing_files:
-                self._get_existing_files()  # Load existing files if the set is empty
+        # Load existing files unless a fresh listing is cached, without it an existing file could be overwritten
+        if self._get_existing_files() is None:
+            logger.error("Not uploading %s without override: the existing files could not be listed", local_path)
+            return
 
-            if file_name is None: 
-                file_name = os.path.basename(local_path)
-            
-            file_name = self.get_file_name(file_name)
-
-            with open(local_path, 'rb') as content_file:
-                file_content = content_file.read()
-                self.folder.upload_file(file_name=file_name, content=file_content)
-
-            self.ctx.execute_query()
-            self.existing_files.add(file_name)
-            print(f"Uploaded file without override: {file_name}")
-        except Exception as e:
-            print(f"Error uploading file without override: {str(e)}")
+        self._upload_one(local_path, file_name, override=False, chunk_size=chunk_size)
 
        
-    def upload_multiple_files(self, local_file_paths):
+    def upload_multiple_files(self, local_file_paths, max_workers=8):
         """
         Upload multiple files to the current SharePoint folder.
 
-        This method allows you to upload multiple files to the current SharePoint folder. It iterates through a list of local
-        file paths, uploads each file. If files with the same names already exist in the folder, the new files will overwrite
-        the existing ones.
+        This method allows you to upload multiple files to the current SharePoint folder. The files are uploaded in parallel
+        by a pool of `max_workers` threads, each with its own SharePoint context. If files with the same names already exist
+        in the folder, the new files will overwrite the existing ones.
 
         :param local_file_paths: A list of local file paths to upload.
         :type local_file_paths: list of str
 
+        :param max_workers: The maximum number of concurrent uploads. Keep it low to avoid SharePoint throttling. (Default: 8)
+        :type max_workers: int
+
         :raises:
             Exception: If an error occurs during the upload process.
         """
         try:
-            self._get_existing_files()
-            for local_path in local_file_paths:
-                self.upload_file(local_path)
-            self._reset_existing_files()
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                uploaded = sum(executor.map(self._upload_one, local_file_paths))
+            logger.info("Uploaded %d files in %.1fs", uploaded, time.monotonic() - start)
         except Exception as e:
-            print(f"Error uploading multiple files: {str(e)}")
+            logger.error("Error uploading multiple files: %s", e)
 
    
-    def upload_multiple_files_without_override(self, local_file_paths):
+    def upload_multiple_files_without_override(self, local_file_paths, max_workers=8):
         """
         Upload multiple files to the current SharePoint folder without overwriting.
 
         This method allows you to upload multiple files to the current SharePoint folder without overwriting existing files.
-        It iterates through a list of local file paths, uploads each file. If files with the same names already exist in the
-        folder, the new files will be assigned unique names to avoid overwriting.
+        The files are uploaded in parallel by a pool of `max_workers` threads. If files with the same names already exist in
+        the folder, the new files will be assigned unique names to avoid overwriting.
 
         :param local_file_paths: A list of local file paths to upload.
         :type local_file_paths: list of str
 
+        :param max_workers: The maximum number of concurrent uploads. Keep it low to avoid SharePoint throttling. (Default: 8)
+        :type max_workers: int
+
         :raises:
             Exception: If an error occurs during the upload process.
         """
         try:
-            self._get_existing_files()
-            for local_path in local_file_paths:
-                self.upload_file_without_override(local_path)
-            self._reset_existing_files()
+            if self._get_existing_files() is None:
+                logger.error("Not uploading %d files without override: the existing files could not be listed", len(local_file_paths))
+                return
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                uploaded = sum(executor.map(lambda local_path: self._upload_one(local_path, override=False), local_file_paths))
+            logger.info("Uploaded %d files without override in %.1fs", uploaded, time.monotonic() - start)
         except Exception as e:
-            print(f"Error uploading multiple files without override: {str(e)}")
+            logger.error("Error uploading multiple files without override: %s", e)
 
+    def upload_multiple_files_bundled(self, local_file_paths, bundle_name):
+        """
+        Upload multiple files to the current SharePoint folder as a single ZIP archive.
+
+        This method is meant for many very small files, where the per-request overhead dominates and uploading the
+        files one by one quickly gets throttled by SharePoint. The files are stored uncompressed in a temporary ZIP
+        archive, which is then uploaded in one request (or one upload session for large archives), overwriting an
+        existing archive with the same name.
+
+        SharePoint does not extract the archive. If the files must exist individually in the library, unpack the
+        archive on the SharePoint side, for example with a Power Automate flow triggered by the upload.
+
+        :param local_file_paths: A list of local file paths to bundle. Files are stored under their base names, which must be unique.
+        :type local_file_paths: list of str
+
+        :param bundle_name: The name of the archive in SharePoint, for example "reports.zip". It must not contain a path.
+        :type bundle_name: str
+
+        :raises:
+            Exception: If an error occurs while bundling or uploading the files.
+        """
+        try:
+            # Files are stored under their base names, two files with the same name would overwrite each other when unpacked
+            # The name is used both for the temporary archive and in SharePoint, so it must be a plain file name
+            if bundle_name in ('', '.', '..') or os.path.basename(bundle_name) != bundle_name or '/' in bundle_name:
+                raise ValueError(f"Bundle name must be a file name without a path: {bundle_name}")
+
+            arcnames = [os.path.basename(local_path) for local_path in local_file_paths]
+            duplicates = sorted(arcname for arcname, count in Counter(arcnames).items() if count > 1)
+            if duplicates:
+                raise ValueError(f"Duplicate file names in bundle: {', '.join(duplicates)}")
+
+            with tempfile.TemporaryDirectory() as temp_dir:
+                bundle_path = os.path.join(temp_dir, bundle_name)
+                with zipfile.ZipFile(bundle_path, 'w', zipfile.ZIP_STORED) as bundle:
+                    for local_path, arcname in zip(local_file_paths, arcnames):
+                        bundle.write(local_path, arcname=arcname)
+
+                if self._upload_one(bundle_path):
+                    logger.info("Uploaded %d files bundled in %s", len(local_file_paths), bundle_name)
+        except Exception as e:
+            logger.error("Error uploading bundled files: %s", e)
+
+
+    def _get_file_url(self, file_name):
+        """
+        Get the server relative URL of a file in the current library and folder context.
+
+        Addressing a file directly by its server relative URL lets SharePoint resolve it in the delete request itself.
+
+        :param file_name: The name of the file.
+        :type file_name: str
+
+        :return: The server relative URL of the file.
+        :rtype: str
+        """
+        return f'{self._folder_server_url}/{file_name}'
 
     def delete_file(self, file_name):
         """
@@ -296,44 +713,72 @@ class SharePointFileManager(SharePointConnection):
             Exception: If an error occurs during the file deletion process.
         """
         try:
-            file = self.folder.files.get_by_url(file_name)
-            file.delete_object()
-            self.ctx.execute_query()
-            print(f"Deleted file: {file_name}")
+            self._execute_query(lambda: self.ctx.web.get_file_by_server_relative_url(self._get_file_url(file_name)).delete_object())
+            self.existing_files.discard(file_name)
+            logger.debug("Deleted file: %s", file_name)
         except Exception as e:
-            print(f"Error deleting file: {str(e)}")
+            logger.error("Error deleting file: %s", e)
 
     
     def delete_multiple_files(self, file_names):
         """
         This method allows you to delete multiple files by providing a list of file names to be deleted from the current SharePoint folder.
+        The deletions are queued and sent in $batch requests of up to 100 files instead of one request per file.
+        A file that cannot be deleted is reported and does not prevent the other files from being deleted.
 
         :param file_names: A list of file names to be deleted.
         :type file_names: List[str]
+
+        :raises:
+            Exception: If an error occurs during the deletion process.
         """
-        for file_name in file_names:
-            self.delete_file(file_name)
+        try:
+            failed = self._execute_batch(file_names, lambda file_name: self.ctx.web.get_file_by_server_relative_url(self._get_file_url(file_name)).delete_object())
+            for file_name, e in failed:
+                logger.error("Error deleting %s: %s", file_name, e)
+
+            failed_names = {file_name for file_name, _ in failed}
+            deleted_names = [file_name for file_name in file_names if file_name not in failed_names]
+            self.existing_files.difference_update(deleted_names)
+            logger.info("Deleted %d files", len(deleted_names))
+        except Exception as e:
+            logger.error("Error deleting multiple files: %s", e)
 
     
     def delete_all_files_and_folders(self):
         """
         Delete all files and folders from the current SharePoint folder.
 
-        This method allows you to delete all files and folders from the current SharePoint folder. It iterates through the files and folders in the current folder and deletes them.
+        This method allows you to delete all files and folders from the current SharePoint folder. It lists the files and folders in the current folder once,
+        then queues their deletion and sends the deletions in $batch requests. A file or folder that cannot be deleted is reported and does not
+        prevent the others from being deleted.
 
         :raises:
             Exception: If an error occurs during the deletion process.
         """
         try:
-            for file in self.get_files():
-                file.delete_object()
-
-            for folder in self.get_folders():
-                folder.delete_object()
-
-            print("All files and folders are deleted")
+            # Snapshot both listings before queueing any delete: every query sent while listing
+            # (next page of files, the folders) would also run the deletes queued so far one by one.
+            # A failed listing raises, so nothing is deleted based on an incomplete snapshot
+            file_names = [file.properties['Name'] for file in self._iter_collection(lambda: self.folder.files, ["Name"])]
+            folder_names = [folder.properties['Name'] for folder in self._iter_collection(lambda: self.folder.folders, ["Name"], page_size=None)]
+
+            # Address the files and folders by URL, so the deletes are queued on the calling thread's current ClientContext
+            failed_files = self._execute_batch(file_names, lambda file_name: self.ctx.web.get_file_by_server_relative_url(self._get_file_url(file_name)).delete_object())
+            failed_folders = self._execute_batch(folder_names, lambda folder_name: self.ctx.web.get_folder_by_server_relative_url(self._get_file_url(folder_name)).delete_object())
+            for name, e in failed_files + failed_folders:
+                logger.error("Error deleting %s: %s", name, e)
+
+            failed_file_names = {file_name for file_name, _ in failed_files}
+            self.existing_files.difference_update(file_name for file_name in file_names if file_name not in failed_file_names)
+            failed_count = len(failed_files) + len(failed_folders)
+            if failed_count:
+                total = len(file_names) + len(folder_names)
+                logger.info("Deleted %d of %d files and folders", total - failed_count, total)
+            else:
+                logger.info("All files and folders are deleted")
         except Exception as e:
-            print(f"Error deleting all files and folders: {str(e)}")
+            logger.error("Error deleting all files and folders: %s", e)
 
     
     def delete_entire_folder(self):
@@ -346,19 +791,21 @@ class SharePointFileManager(SharePointConnection):
             Exception: If an error occurs during the deletion process.
         """
         try:
-            self.folder.delete_object()
-            self.ctx.execute_query()
-            print("SharePoint folder and its contents are deleted")
+            self._execute_query(lambda: self.folder.delete_object())
+            self._reset_existing_files()
+            self._tls.folder_cache.pop((self.library_name, self.folder_name), None)
+            logger.info("SharePoint folder and its contents are deleted")
         except Exception as e:
-            print(f"Error deleting the SharePoint folder: {str(e)}")
+            logger.error("Error deleting the SharePoint folder: %s", e)
 
     def get_recently_deleted_items(self, max_items=5):
         """
         Retrieve recently deleted items from the SharePoint recycle bin.
 
         This method allows you to retrieve recently deleted items from the SharePoint recycle bin. You can specify the maximum number of items to retrieve (default is 5).
+        The sorting and limiting are done by SharePoint ($orderby and $top), so only the requested items are transferred.
 
-        :param max_items: The maximum number of recently deleted items to retrieve. Default is 10.
+        :param max_items: The maximum number of recently deleted items to retrieve, or None for all of them. Default is 5.
         :type max_items: int
 
         :return: A list of SharePoint items recently deleted from the recycle bin.
@@ -368,24 +815,15 @@ class SharePointFileManager(SharePointConnection):
             Exception: If an error occurs during the retrieval process.
         """
         try:
-            recycle_bin = self.ctx.site.recycle_bin
-            self.ctx.load(recycle_bin)
-            self.ctx.execute_query()
+            # Let SharePoint sort by DeletedDate in descending order and return the latest 'max_items' items
+            items = self.ctx.site.recycle_bin.order_by('DeletedDate desc')
+            if max_items is not None:
+                items = items.top(max_items)
+            self._execute_query(lambda: self.ctx.load(items))
 
-            # Get all items from the recycle bin
-            items = recycle_bin.get()
-            self.ctx.load(items)
-            self.ctx.execute_query()
-
-            # Sort the items by DeletedDate in descending order
-            items = sorted(items, key=lambda item: item.deleted_date, reverse=True)
-
-            # Take the latest 'max_items' items or all if 'max_items' is not specified
-            items = items[:max_items] if max_items is not None else items
-
-            return items
+            return list(items)
         except Exception as e:
-            print(f"Error getting recently deleted items: {str(e)}")
+            logger.error("Error getting recently deleted items: %s", e)
 
     def recover_data(self, num_to_restore=1):
         """
@@ -393,7 +831,10 @@ class SharePointFileManager(SharePointConnection):
 
         This method allows you to recover a specified number of recently deleted items from the SharePoint recycle bin.
         It reuses the `get_recently_deleted_items` method to retrieve the recently deleted items and restores them (default is 1).
-        After the recovery process, it prints information about the items restored.
+        The restore operations are queued and sent together in $batch requests. An item that cannot be restored is
+        reported and does not prevent the other items from being restored.
+        Each restored item is logged at DEBUG level, each item that could not be restored at ERROR level, and the
+        number of restored items at INFO level.
 
         :param num_to_restore: The number of recently deleted items to recover.
         :type num_to_restore: int
@@ -408,18 +849,17 @@ class SharePointFileManager(SharePointConnection):
             recently_deleted_items = self.get_recently_deleted_items(num_to_restore)
 
             # Restore the specified number of files
-            restored_count = 0
-            for item in recently_deleted_items:
-                if restored_count < num_to_restore:
-                    try:
-                        # Restore the file
-                        item.restore()
-                    except:
-                        # Restore the folder
-                        self.restore_folder(item)
-                    self.ctx.execute_query()
-                    print(f"Item recovered to {item.properties['DirName']} file name is {item.properties['Title']}")
-                    restored_count += 1
-            print(f"Restored {restored_count} items")
+            items_to_restore = recently_deleted_items[:num_to_restore]
+
+            # Address the items by id, so the restores are queued on the calling thread's current ClientContext
+            failed = self._execute_batch(items_to_restore, lambda item: self.ctx.site.recycle_bin.get_by_id(item.properties['Id']).restore())
+            for item, e in failed:
+                logger.error("Error restoring %s: %s", item.properties['Title'], e)
+
+            failed_items = [item for item, _ in failed]
+            restored_items = [item for item in items_to_restore if item not in failed_items]
+            for item in restored_items:
+                logger.debug("Item recovered to %s file name is %s", item.properties['DirName'], item.properties['Title'])
+            logger.info("Restored %d items", len(restored_items))
         except Exception as e:
-            print(f"Error restoring files: {str(e)}")
\ No newline at end of file
+            logger.error("Error restoring files: %s", e)
\ No newline at end of file
@@ -0,0 +1,67 @@
+from urllib.parse import urlparse, parse_qs, unquote
+import unittest
+from unittest import mock
+import json
+
+from requests import Response
+from office365.runtime.transport.requests_transport import RequestsTransport
+
+from sharepointManager import SharePointFileManager
+
+
+def _response(status_code=200, payload=None, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.headers['Content-Type'] = 'application/json;odata=verbose'
+    response.headers.update(headers or {})
+    response._content = json.dumps(payload or {'d': {}}).encode('utf-8')
+    return response
+
+
+class ListingTest(unittest.TestCase):
+    """
+    Listing of a large folder, with the network replaced by a folder of 1,200 files that throttles the second page once.
+    """
+
+    FILE_COUNT = 1200
+
+    def setUp(self):
+        self.throttled = set()
+
+        def execute(transport, request):
+            if request.url.lower().endswith('/_api/contextinfo'):
+                return _response(payload={'d': {'GetContextWebInformation': {'FormDigestValue': 'digest', 'FormDigestTimeoutSeconds': 1800}}})
+            query = parse_qs(urlparse(request.url).query)
+            skip = int(query.get('$skip', ['0'])[0])
+            top = int(query.get('$top', [str(self.FILE_COUNT)])[0])
+            if skip == 500 and skip not in self.throttled:
+                self.throttled.add(skip)
+                return _response(429, {'error': {'message': {'value': 'Throttled'}}}, {'Retry-After': '0'})
+            names = [f'file_{index}.txt' for index in range(skip, min(skip + top, self.FILE_COUNT))]
+            self.assertIn('/Files', unquote(request.url))
+            return _response(payload={'d': {'results': [{'Name': name} for name in names]}})
+
+        patches = [
+            mock.patch.object(RequestsTransport, 'execute', execute),
+            mock.patch.object(SharePointFileManager, 'get_auth_headers', return_value={'Authorization': 'Bearer token'}),
+            mock.patch('time.sleep'),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.manager = SharePointFileManager('https://contoso.sharepoint.com/sites/site', '/sites/site', client_id='id', client_secret='secret')
+        self.manager.set_folder_ctx('Shared Documents', 'Folder')
+
+    def test_existing_files_retries_throttled_page(self):
+        file_names = self.manager._get_existing_files()
+        self.assertEqual(self.throttled, {500})
+        self.assertEqual(len(file_names), self.FILE_COUNT)
+
+    def test_get_files_lists_every_page(self):
+        names = [file.properties['Name'] for file in self.manager.get_files(["Name"])]
+        self.assertEqual(names, [f'file_{index}.txt' for index in range(self.FILE_COUNT)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+import tempfile
+import mmap
+import json
+import os
+
+from requests import Response
+from office365.runtime.transport.requests_transport import RequestsTransport
+
+from sharepointManager import SharePointFileManager
+
+
+def _response(status_code=200, payload=None):
+    response = Response()
+    response.status_code = status_code
+    response.headers['Content-Type'] = 'application/json;odata=verbose'
+    response._content = json.dumps(payload or {'d': {}}).encode('utf-8')
+    return response
+
+
+class UploadSmokeTest(unittest.TestCase):
+    """
+    Smoke test of the single-request upload path, with the network replaced by canned SharePoint responses.
+    """
+
+    def setUp(self):
+        self.requests = []
+
+        def execute(transport, request):
+            if request.url.lower().endswith('/_api/contextinfo'):
+                return _response(payload={'d': {'GetContextWebInformation': {'FormDigestValue': 'digest', 'FormDigestTimeoutSeconds': 1800}}})
+            data = request.data
+            self.requests.append((request.url, bytes(data.read() if hasattr(data, 'read') else data), type(data)))
+            return _response(payload={'d': {'Name': 'uploaded'}})
+
+        patches = [
+            mock.patch.object(RequestsTransport, 'execute', execute),
+            mock.patch.object(SharePointFileManager, 'get_auth_headers', return_value={'Authorization': 'Bearer token'}),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.manager = SharePointFileManager('https://contoso.sharepoint.com/sites/site', '/sites/site', client_id='id', client_secret='secret')
+        self.manager.set_folder_ctx('Shared Documents', 'Folder')
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _write(self, name, content):
+        local_path = os.path.join(self.temp_dir.name, name)
+        with open(local_path, 'wb') as local_file:
+            local_file.write(content)
+        return local_path
+
+    def test_upload_small_file(self):
+        local_path = self._write('small.txt', b'hello')
+        self.assertTrue(self.manager._upload_one(local_path))
+        url, content, body_type = self.requests[-1]
+        self.assertIn("/Files/add(", url)
+        self.assertIn("small.txt", url)
+        self.assertEqual(content, b'hello')
+        # The memory map is sent as the request body, not copied into a bytes object first
+        self.assertIs(body_type, mmap.mmap)
+
+    def test_upload_empty_file(self):
+        local_path = self._write('empty.txt', b'')
+        self.assertTrue(self.manager._upload_one(local_path))
+        url, content, _ = self.requests[-1]
+        self.assertIn("empty.txt", url)
+        self.assertEqual(content, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()